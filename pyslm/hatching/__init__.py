@@ -1,4 +1,4 @@
 from .sorting import AlternateSort, FlipSort,GreedySort, HatchDirectionalSort, LinearSort, UnidirectionalSort
-from .hatching import BaseHatcher, Hatcher, BasicIslandHatcher, InnerHatchRegion, StripeHatcher, getExposurePoints
+from .hatching import BaseHatcher, Hatcher, BasicIslandHatcher, InnerHatchRegion, StripeHatcher, getExposurePoints, hatchLayers
 from .islandHatcher import Island, IslandHatcher
 from .utils import *
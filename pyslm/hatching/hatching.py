@@ -1,5 +1,8 @@
 import abc
+import math
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, List, Optional, Tuple, Union
 import logging
 
@@ -11,6 +14,158 @@ from shapely.geometry import Polygon as ShapelyPolygon
 from .sorting import AlternateSort, BaseSort, LinearSort
 from ..geometry import Layer, Model, ContourGeometry, HatchGeometry
 
+try:
+    from numba import njit, prange
+except BaseException:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _expandExposurePointsKernel(p0, delta, sign, numPoints, starts, pointDistance, energyPerExposure, out):
+        """
+        A compiled kernel which writes the expanded exposure points directly into the pre-allocated output
+        buffer in a single parallel pass over the segments - avoiding the intermediate repeat arrays required
+        by the NumPy path. The segment direction is normalised in-register per segment, so no intermediate
+        direction array is materialised either.
+        """
+        for h in prange(numPoints.shape[0]):
+            invLen = sign / np.sqrt(delta[h, 0] * delta[h, 0] + delta[h, 1] * delta[h, 1])
+            dirX = delta[h, 0] * invLen
+            dirY = delta[h, 1] * invLen
+
+            start = starts[h]
+            for k in range(numPoints[h]):
+                i = start + k
+                out[i, 0] = p0[h, 0] + pointDistance * k * dirX
+                out[i, 1] = p0[h, 1] + pointDistance * k * dirY
+                if out.shape[1] > 2:
+                    out[i, 2] = energyPerExposure
+
+    @njit(parallel=True, cache=True)
+    def _buildStripeHatchKernel(startX, endX, yRows, parity, numSamples, rowStarts, orderBase, out):
+        """
+        A compiled kernel which writes the un-rotated stripe hatch vectors directly into the pre-allocated
+        output buffer in a single parallel pass over the stripes. The rotation is applied afterwards so that
+        the assembled template remains independent of the layer hatch angle.
+        """
+        for i in prange(startX.shape[0]):
+            p = parity[i]
+
+            for k in range(numSamples[i]):
+                y = yRows[p, k]
+
+                for m in range(2):
+                    r = rowStarts[i] + 2 * k + m
+
+                    out[r, 0] = startX[i] if m == 0 else endX[i]
+                    out[r, 1] = y
+                    out[r, 2] = orderBase[i] + k
+
+    @njit(parallel=True, cache=True)
+    def _buildIslandHatchKernel(startX, endX, startY, endY, sampleStart, parity, numSamples, rowStarts,
+                                orderBase, spacing, out):
+        """
+        A compiled kernel which writes the un-rotated island hatch vectors directly into the pre-allocated
+        output buffer in a single parallel pass over the islands. The scan axis alternates with the island
+        parity as in the NumPy construction.
+        """
+        for i in prange(startX.shape[0]):
+
+            for k in range(numSamples[i]):
+                samplePos = np.float32(sampleStart[i] + k * spacing)
+
+                for m in range(2):
+                    r = rowStarts[i] + 2 * k + m
+
+                    if parity[i]:
+                        out[r, 0] = startX[i] if m == 0 else endX[i]
+                        out[r, 1] = samplePos
+                    else:
+                        out[r, 0] = samplePos
+                        out[r, 1] = startY[i] if m == 0 else endY[i]
+
+                    out[r, 2] = orderBase[i] + k
+
+    @njit(cache=True)
+    def _minMax2D(path):
+        """
+        A compiled kernel returning the minimum and maximum of the first two coordinate columns in a single
+        pass over the path, rather than the separate passes required by individual NumPy reductions.
+        """
+        mnX = np.inf
+        mnY = np.inf
+        mxX = -np.inf
+        mxY = -np.inf
+
+        for i in range(path.shape[0]):
+            x = path[i, 0]
+            y = path[i, 1]
+
+            if x < mnX: mnX = x
+            if x > mxX: mxX = x
+            if y < mnY: mnY = y
+            if y > mxY: mxY = y
+
+        return mnX, mnY, mxX, mxY
+
+
+def _expandExposurePoints(p0: np.ndarray, delta: np.ndarray, lineDist: np.ndarray, numPoints: np.ndarray,
+                          sign: float, pointDistance: float, energyPerExposure: float,
+                          out: np.ndarray) -> np.ndarray:
+    """
+    An internal kernel which discretises a set of scan vector segments into exposure points. The segments are
+    provided in a structure-of-arrays form - the start point and the difference vector of each segment - so that
+    both hatch and contour geometry share a single expansion path. The points are written directly into the
+    provided output buffer, which may be a view into a larger layer-wide allocation.
+
+    :param p0: The :math:`(n \\times 2)` start coordinates of each segment
+    :param delta: The :math:`(n \\times 2)` difference vector of each segment
+    :param lineDist: The :math:`(n \\times 1)` length of each segment
+    :param numPoints: The number of exposure points generated along each segment
+    :param sign: The direction (:math:`\\pm 1`) applied along each segment
+    :param pointDistance: The distance between exposure points (mm)
+    :param energyPerExposure: The energy deposited per exposure point
+    :param out: The output buffer to fill - the third column receives the energy deposited when present
+    :return: The expanded exposure points
+    """
+
+    # Single precision is sufficient for the micron-scale exposure positions and halves the memory traffic
+    # of the expansion
+    p0 = np.ascontiguousarray(p0, dtype=np.float32)
+
+    includePowerDeposited = out.shape[1] > 2
+    totalPoints = len(out)
+
+    # The cumulative offset of each segment within the expanded output
+    starts = np.cumsum(numPoints) - numPoints
+
+    if njit is not None:
+        # The compiled kernel fuses the normalisation and expansion into a single parallel pass over the
+        # segments and writes directly into the output buffer
+        _expandExposurePointsKernel(p0, np.ascontiguousarray(delta, dtype=np.float32), np.float32(sign),
+                                    numPoints, starts, np.float32(pointDistance),
+                                    np.float32(energyPerExposure), out)
+        return out
+
+    # Normalise each scan vector direction
+    dirUnit = (sign * delta / lineDist).astype(np.float32, copy=False)
+
+    # The local point index along each segment (0..numPoints-1) is recovered by subtracting the
+    # cumulative offset of each segment from a global running index
+    idx = np.arange(totalPoints, dtype=np.float32) - np.repeat(starts, numPoints)
+
+    out[:, :2] = np.repeat(dirUnit, numPoints, axis=0)
+    out[:, :2] *= (np.float32(pointDistance) * idx)[:, None]
+    out[:, :2] += np.repeat(p0, numPoints, axis=0)
+
+    # Fill the extra column for the energy deposited per exposure
+    if includePowerDeposited:
+        out[:, 2] = energyPerExposure
+
+    return out
+
 
 def getExposurePoints(layer: Layer, models: List[Model], includePowerDeposited: bool = True):
     """
@@ -31,15 +186,23 @@ def getExposurePoints(layer: Layer, models: List[Model], includePowerDeposited:
     if not isinstance(models, list):
         models = [models]
 
-    exposurePoints = []
+    # Index the models and buildstyles once so each layer geometry resolves in constant time
+    modelMap = {model.mid: model for model in models}
+    buildStyleMap = {(model.mid, buildStyle.bid): buildStyle for model in models
+                                                             for buildStyle in model.buildStyles}
+
+    # First pass - prepare the segment arrays for each geometry and the total number of exposure points so
+    # the output is allocated once up-front rather than concatenated at the end
+    geomSegments = []
+    totalPoints = 0
 
     for layerGeom in layer.geometry:
 
         # Get the model given the mid
-        model = next(x for x in models if x.mid == layerGeom.mid)
+        model = modelMap[layerGeom.mid]
 
         #Get the buildstyle from the model
-        buildStyle = next(x for x in model.buildStyles if x.bid == layerGeom.bid)
+        buildStyle = buildStyleMap[(layerGeom.mid, layerGeom.bid)]
 
         if buildStyle.pointDistance < 1:
             raise ValueError('The point distance parameter in the buildstyle (mid: {:d}, bid: {:d}) must be set'.format(model.mid, buildStyle.bid))
@@ -49,94 +212,90 @@ def getExposurePoints(layer: Layer, models: List[Model], includePowerDeposited:
 
         if isinstance(layerGeom, HatchGeometry):
 
-            # Calculate the length of the hatch vector and the direction
+            # Prepare the start point and difference vector of each hatch vector
             coords = layerGeom.coords.reshape(-1, 2, 2)
             delta = np.diff(coords, axis=1).reshape(-1, 2)
-            lineDist = np.hypot(delta[:, 0], delta[:, 1]).reshape(-1, 1)
-
-            # Normalise each scan vector direction
-            dir = -1.0 * delta / lineDist
-
-            # Calculate the number of exposure points across the hatch vector based on its length
-            numPoints = np.ceil(lineDist / pointDistance).astype(int)
-
-            # Pre-populate some arrays to extrapolate the exposure points from
-            totalPoints = int(np.sum(numPoints))
-            idxArray = np.zeros([totalPoints, 1])
-            pntsArray = np.zeros([totalPoints, 2])
-            dirArray = np.zeros([totalPoints, 2])
-
-            # Take the first coordinate
             p0 = coords[:, 1, :].reshape(-1, 2)
+            sign = -1.0
 
-            idx = 0
-            for i in range(len(numPoints)):
-                j = int(numPoints[i])
-                idxArray[idx:idx + j, 0] = np.arange(0, j)
-                pntsArray[idx:idx + j] = p0[i]
-                dirArray[idx:idx + j] = dir[i]
-                idx += j
+        elif isinstance(layerGeom, ContourGeometry):
 
-            # Calculate the hatch exposure points
-            hatchExposurePoints = pntsArray + pointDistance * idxArray * dirArray
+            # Prepare the start point and difference vector of each contour segment
+            coords = layerGeom.coords
+            delta = np.diff(coords, axis=0)
+            p0 = coords[:-1]
+            sign = 1.0
 
-            # Add an extra column for the energy deposited per exposure
-            if includePowerDeposited:
-                col = np.ones([len(hatchExposurePoints),1])
-                col[:] = energyPerExposure
+        else:
+            continue
 
-                hatchExposurePoints = np.hstack([hatchExposurePoints, col])
+        lineDist = np.hypot(delta[:, 0], delta[:, 1]).reshape(-1, 1)
 
-            # append to the list
-            exposurePoints.append(hatchExposurePoints)
+        # Calculate the number of exposure points across each segment based on its length
+        numPoints = np.ceil(lineDist / pointDistance).astype(int).ravel()
+        totalPoints += int(np.sum(numPoints))
 
-        if isinstance(layerGeom, ContourGeometry):
+        geomSegments.append((p0, delta, lineDist, numPoints, sign, pointDistance, energyPerExposure))
 
-            # Calculate the length of the hatch vector and the direction
-            coords = layerGeom.coords
+    # Second pass - expand each geometry directly into its slice of the layer-wide output buffer
+    exposurePoints = np.empty([totalPoints, 3 if includePowerDeposited else 2], dtype=np.float32)
 
-            delta = np.diff(coords, axis=0)
-            lineDist = np.hypot(delta[:, 0], delta[:, 1]).reshape(-1, 1)
+    start = 0
 
-            # Normalise each scan vector direction
-            dir = 1.0 * delta / lineDist
+    for p0, delta, lineDist, numPoints, sign, pointDistance, energyPerExposure in geomSegments:
+        size = int(np.sum(numPoints))
+        _expandExposurePoints(p0, delta, lineDist, numPoints, sign, pointDistance, energyPerExposure,
+                              exposurePoints[start:start + size])
+        start += size
 
-            # Calculate the number of exposure points across the hatch vector based on its length
-            numPoints = np.ceil(lineDist / pointDistance).astype(int)
+    return exposurePoints
 
-            # Pre-populate some arrays to extrapolate the exposure points from
-            totalPoints = int(np.sum(numPoints))
-            idxArray = np.zeros([totalPoints, 1])
-            pntsArray = np.zeros([totalPoints, 2])
-            dirArray = np.zeros([totalPoints, 2])
 
-            # Take the first coordinate
-            p0 = coords
+def _hatchLayer(args) -> Union['Layer', None]:
+    """
+    An internal worker which hatches a single layer boundary - the hatcher and boundary are passed together
+    as a tuple so the method may be dispatched directly via `map` across a process pool.
+
+    :param args: A tuple of the hatcher and the layer boundary to hatch
+    :return: The hatched :class:`Layer`
+    """
+    hatcher, boundary = args
+    return hatcher.hatch(boundary)
 
-            idx = 0
-            for i in range(len(numPoints)):
-                j = int(numPoints[i])
-                idxArray[idx:idx + j, 0] = np.arange(0, j)
-                pntsArray[idx:idx + j] = p0[i]
-                dirArray[idx:idx + j] = dir[i]
-                idx += j
 
-            # Calculate the hatch exposure points
-            hatchExposurePoints = pntsArray + pointDistance * idxArray * dirArray
+def hatchLayers(hatcher: 'BaseHatcher', boundaries, numWorkers: Optional[int] = None,
+                chunkSize: int = 8) -> List['Layer']:
+    """
+    A utility method which hatches a list of per-layer boundaries in parallel across a process pool. Each
+    layer is hatched independently, so the layers are distributed across the available cores and the hatched
+    :class:`Layer` results are returned in the original layer order. The hatcher instance is pickled to the
+    worker processes, therefore any custom hatcher state must be pickleable.
 
-            # Add an extra column for the energy deposited per exposure
-            if includePowerDeposited:
-                col = np.ones([len(hatchExposurePoints),1])
-                col[:] = energyPerExposure
+    .. note::
+        The workers are started with the `spawn` method, therefore this must be called from within an
+        `if __name__ == '__main__':` guard in a script. Forked workers are not used since the parallel
+        numba kernels leave forked children with an inconsistent threading runtime, which hangs the parent
+        interpreter at shutdown once any hatching has already run in-process.
+
+    :param hatcher: The configured hatcher applied to each layer boundary
+    :param boundaries: A list of per-layer boundaries to hatch
+    :param numWorkers: The number of worker processes - defaults to the number of cores available
+    :param chunkSize: The number of layers dispatched to a worker at a time
+    :return: The list of hatched layers
+    """
 
-                hatchExposurePoints = np.hstack([hatchExposurePoints, col])
+    boundaries = list(boundaries)
 
-            # append to the list
-            exposurePoints.append(hatchExposurePoints)
+    if len(boundaries) == 0:
+        return []
 
-    exposurePoints = np.vstack(exposurePoints)
+    if numWorkers == 1:
+        return [hatcher.hatch(boundary) for boundary in boundaries]
 
-    return exposurePoints
+    with ProcessPoolExecutor(max_workers=numWorkers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(_hatchLayer, ((hatcher, boundary) for boundary in boundaries),
+                                 chunksize=chunkSize))
 
 
 class BaseHatcher(abc.ABC):
@@ -169,6 +328,36 @@ class BaseHatcher(abc.ABC):
         Therefore at a small performance cost 1e5 is recommended.
     """
 
+    ARC_TOLERANCE: float = 0.25
+    """
+    The maximum deviation permitted when arcs are approximated during round-join offsetting, expressed in the
+    coordinate units (mm). ClipperLib2 interprets its arc tolerance in the scaled integer domain, so without
+    explicitly setting this the high :attr:`CLIPPER_SCALEFACTOR` would generate an excessive number of
+    micro-segments around each rounded corner, severely slowing both the offsetting and all downstream clipping
+    operations. Reduce this value to trade performance for smoother rounded joins.
+    """
+
+    NUM_DIVISIONS: int = 1
+    """
+    The number of spatial subdivisions (:math:`n \\times n`) used when clipping hatch vectors in
+    :meth:`clipLines`. ClipperLib's cost grows super-linearly with the input size, so for large dense layers
+    subdividing the boundary into tiles and clipping each tile independently can be substantially faster.
+
+    .. note::
+        Hatch vectors which cross a tile border are split at the border into collinear segments, so this
+        should remain at the default of `1` where contiguous scan vectors are required.
+    """
+
+    OFFSET_NUM_DIVISIONS: int = 1
+    """
+    The number of spatial subdivisions (:math:`n \\times n`) used when offsetting boundaries in
+    :meth:`offsetBoundary`. Offsetting is a local operation - the result within a tile depends only on the
+    boundary lying within the offset distance of it - so a complex boundary may be cut into tiles expanded
+    by the offset distance, offset independently, trimmed back to each tile and unioned. This keeps each
+    ClipperLib invocation small for very large dense boundaries. The default of `1` offsets the boundary in
+    a single operation.
+    """
+
     def __init__(self):
         pass
 
@@ -185,7 +374,10 @@ class BaseHatcher(abc.ABC):
         :param coords: The list of hatches generated from clipping operations
         :return: The hatch coordinates transfromed into a :math:`(n \\times 2 \\times 3)` numpy array.
         """
-        return np.transpose(np.dstack(coords), axes=[2, 0, 1])
+        # Stacking the (2 x 3) paths along the first axis directly yields the contiguous (n x 2 x 3) layout
+        # without the intermediate (2 x 3 x n) array and transpose - and is a no-op if the clipped paths have
+        # already been assembled into an array
+        return np.asarray(coords)
 
     @classmethod
     def error(cls) -> float:
@@ -211,6 +403,64 @@ class BaseHatcher(abc.ABC):
         """
         return [BaseHatcher.offsetBoundary(poly, offset) for poly in polygons]
 
+    @staticmethod
+    def _buildContourGeometries(paths, subType: str) -> List[ContourGeometry]:
+        """
+        Builds a list of closed :class:`~pyslm.geometry.ContourGeometry` from a set of open boundary paths.
+        Each path is closed by appending its first coordinate.
+
+        :param paths: The list of boundary paths to convert
+        :param subType: The contour sub-type assigned to each geometry
+        :return: The list of contour geometries generated
+        """
+
+        if len(paths) == 0:
+            return []
+
+        # All the closed rings share a single backing buffer - each ring is copied in followed by its closing
+        # coordinate and the geometry coordinates are provided as slice views into the buffer. This avoids a
+        # separate allocation per ring which dominates layers with many small boundaries.
+        lens = np.fromiter((len(path) for path in paths), dtype=np.int64, count=len(paths))
+        ends = np.cumsum(lens + 1)
+        starts = ends - (lens + 1)
+
+        buffer = np.empty([int(ends[-1]), 2])
+
+        geometries = []
+
+        for i, path in enumerate(paths):
+            buffer[starts[i]:ends[i] - 1] = path
+            buffer[ends[i] - 1] = path[0]
+
+            contourGeometry = ContourGeometry()
+            contourGeometry.coords = buffer[starts[i]:ends[i]]
+            contourGeometry.subType = subType
+            geometries.append(contourGeometry)
+
+        return geometries
+
+    @staticmethod
+    def makeOffsetter(paths) -> pyclipr.ClipperOffset:
+        """
+        Creates a configured :class:`pyclipr.ClipperOffset` with the paths uploaded. The offsetter may be
+        re-used across multiple offsets of the same paths by calling `execute` with different offset
+        distances, which avoids re-uploading the paths for each offset.
+
+        :param paths: Closed polygon path list for offsetting
+        :return: A configured offsetter with the paths added
+        """
+
+        pc = pyclipr.ClipperOffset()
+        pc.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
+
+        # The arc tolerance is interpreted in the scaled domain so this must be scaled accordingly to bound
+        # the number of segments generated around each rounded join
+        pc.arcTolerance = BaseHatcher.ARC_TOLERANCE * BaseHatcher.CLIPPER_SCALEFACTOR
+
+        pc.addPaths(paths, pyclipr.JoinType.Round)
+
+        return pc
+
     @staticmethod
     def offsetBoundary(paths, offset: float):
         """
@@ -221,15 +471,87 @@ class BaseHatcher(abc.ABC):
         :return: A list of boundaries offset from the subject
         """
 
-        pc = pyclipr.ClipperOffset()
-        pc.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
-        pc.addPaths(paths, pyclipr.JoinType.Round)
+        if BaseHatcher.OFFSET_NUM_DIVISIONS > 1:
+            return BaseHatcher._offsetBoundaryTiled(paths, offset, BaseHatcher.OFFSET_NUM_DIVISIONS)
+
+        pc = BaseHatcher.makeOffsetter(paths)
 
         # Perform the offseting operation
         offsetContours = pc.execute(offset)
 
         return offsetContours
 
+    @staticmethod
+    def _offsetBoundaryTiled(paths, offset: float, numDivisions: int):
+        """
+        Offsets the boundary using an :math:`n \\times n` spatial subdivision of its bounding box. The offset
+        result within a tile depends only on the boundary lying within the offset distance of it, so the
+        boundary is intersected with each tile rectangle expanded by the offset distance, offset
+        independently, trimmed back to the exact tile and finally unioned across the tiles - keeping each
+        ClipperLib invocation small.
+
+        :param paths: Closed polygon path list for offsetting
+        :param offset: The offset applied to the polygon
+        :param numDivisions: The number of subdivisions along each axis
+        :return: A list of boundaries offset from the subject
+        """
+
+        bbox = BaseHatcher.polygonBoundingBox(paths)
+
+        # The margin around each tile beyond which the boundary cannot influence the offset within it. The
+        # grid is also expanded by the margin so outward offsets are not trimmed at the outer tiles.
+        margin = abs(offset) + BaseHatcher.error()
+
+        xDiv = np.linspace(bbox[0] - margin, bbox[2] + margin, numDivisions + 1)
+        yDiv = np.linspace(bbox[1] - margin, bbox[3] + margin, numDivisions + 1)
+
+        offsetPaths = []
+
+        for i in range(numDivisions):
+            for j in range(numDivisions):
+
+                expandedTile = np.array([[xDiv[i] - margin, yDiv[j] - margin],
+                                         [xDiv[i + 1] + margin, yDiv[j] - margin],
+                                         [xDiv[i + 1] + margin, yDiv[j + 1] + margin],
+                                         [xDiv[i] - margin, yDiv[j + 1] + margin]])
+
+                # Reduce the boundary to the tile rectangle expanded by the margin
+                pc = pyclipr.Clipper()
+                pc.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
+                pc.addPaths(paths, pyclipr.Subject)
+                pc.addPath(expandedTile, pyclipr.Clip)
+                tileBoundary = pc.execute(pyclipr.Intersection, pyclipr.FillRule.NonZero)
+
+                if len(tileBoundary) == 0:
+                    continue
+
+                # Offset the reduced boundary - only the region within the exact tile is valid
+                tileOffset = BaseHatcher.makeOffsetter(tileBoundary).execute(offset)
+
+                if len(tileOffset) == 0:
+                    continue
+
+                tile = np.array([[xDiv[i], yDiv[j]],
+                                 [xDiv[i + 1], yDiv[j]],
+                                 [xDiv[i + 1], yDiv[j + 1]],
+                                 [xDiv[i], yDiv[j + 1]]])
+
+                pc2 = pyclipr.Clipper()
+                pc2.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
+                pc2.addPaths(tileOffset, pyclipr.Subject)
+                pc2.addPath(tile, pyclipr.Clip)
+                offsetPaths.extend(pc2.execute(pyclipr.Intersection, pyclipr.FillRule.NonZero))
+
+        if len(offsetPaths) == 0:
+            return []
+
+        # Union the per-tile offsets back into the final boundary, merging the shared tile edges
+        pc = pyclipr.Clipper()
+        pc.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
+        pc.addPaths(offsetPaths, pyclipr.Subject)
+
+        return pc.execute(pyclipr.Union, pyclipr.FillRule.NonZero)
+
 
     @staticmethod
     def polygonBoundingBox(obj: Any) -> np.ndarray:
@@ -245,14 +567,22 @@ class BaseHatcher(abc.ABC):
         if not isinstance(obj, list):
             obj = [obj]
 
-        bboxList = []
+        if njit is not None:
+            # Reduce each polygon in a single fused min/max pass without concatenating the coordinates
+            bbox = np.array([np.inf, np.inf, -np.inf, -np.inf])
 
-        for subObj in obj:
-            path = np.array(subObj)[:, :2]  # Use only coordinates in XY plane
-            bboxList.append(np.hstack([np.min(path, axis=0), np.max(path, axis=0)]))
+            for subObj in obj:
+                mnX, mnY, mxX, mxY = _minMax2D(np.asarray(subObj))
+                bbox[0] = min(bbox[0], mnX)
+                bbox[1] = min(bbox[1], mnY)
+                bbox[2] = max(bbox[2], mxX)
+                bbox[3] = max(bbox[3], mxY)
 
-        bboxList = np.vstack(bboxList)
-        bbox = np.hstack([np.min(bboxList[:, :2], axis=0), np.max(bboxList[:, -2:], axis=0)])
+            return bbox
+
+        # Concatenate all the coordinates in the XY plane and reduce across the entire set in a single pass
+        path = np.concatenate([np.asarray(subObj)[:, :2] for subObj in obj], axis=0)
+        bbox = np.concatenate([path.min(axis=0), path.max(axis=0)])
 
         return bbox
 
@@ -267,10 +597,8 @@ class BaseHatcher(abc.ABC):
         :return: A :math:`(1 \\times 6)` numpy array of the bounding box
         """
 
-        bboxList = [BaseHatcher.polygonBoundingBox(boundary) for boundary in boundaries]
-
-        bboxList = np.vstack(bboxList)
-        bbox = np.hstack([np.min(bboxList[:, :2], axis=0), np.max(bboxList[:, -2:], axis=0)])
+        bboxList = np.vstack([BaseHatcher.polygonBoundingBox(boundary) for boundary in boundaries])
+        bbox = np.concatenate([bboxList[:, :2].min(axis=0), bboxList[:, -2:].max(axis=0)])
 
         return bbox
 
@@ -294,10 +622,31 @@ class BaseHatcher(abc.ABC):
             # Input from generateHatching is empty so return empty
             return None
 
+        if BaseHatcher.NUM_DIVISIONS > 1:
+            return BaseHatcher._clipLinesTiled(paths, lines, BaseHatcher.NUM_DIVISIONS)
+
+        segs = lines.reshape(-1, 2, 3)
+
+        # Pre-reject hatch vectors lying entirely beyond one side of the boundary bounding box - these can
+        # never intersect the boundary so Clipper needn't process them
+        bbox = BaseHatcher.polygonBoundingBox(paths)
+        outside = np.all(segs[:, :, 0] < bbox[0], axis=1) | np.all(segs[:, :, 0] > bbox[2], axis=1) | \
+                  np.all(segs[:, :, 1] < bbox[1], axis=1) | np.all(segs[:, :, 1] > bbox[3], axis=1)
+
+        if outside.any():
+            segs = segs[~outside]
+
+        if len(segs) == 0:
+            return []
+
+        # Order the boundary paths by their minimum y extent - the hatch vectors are already generated in
+        # sweep order, and coherent clip extents reduce the work of Clipper's internal sweepline
+        paths = sorted(paths, key=lambda path: np.asarray(path)[:, 1].min())
+
         pc2 = pyclipr.Clipper()
         pc2.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
 
-        pc2.addPaths(lines.reshape(-1,2,3), pyclipr.Subject, True)
+        pc2.addPaths(segs, pyclipr.Subject, True)
         pc2.addPaths(paths, pyclipr.Clip)
         out = pc2.execute(pyclipr.Intersection, pyclipr.FillRule.NonZero, returnOpenPaths=True, returnZ=True)
 
@@ -306,6 +655,129 @@ class BaseHatcher(abc.ABC):
 
         return np.dstack([lineXY, lineZ])
 
+    @staticmethod
+    def clipLinesBatched(paths, lineBatches):
+        """
+        Clips multiple batches of lines (hatches) against a single closed set of boundary paths in one
+        ClipperLib execution. The boundary is uploaded and indexed once and every batch is clipped in a
+        single call by biasing the sort order stored in the z component into a disjoint range per batch,
+        which is used to separate the clipped output again afterwards. This amortises the engine setup and
+        the Python transition across the batches compared with calling :meth:`clipLines` per batch.
+
+        .. note::
+            ClipperLib2 clears both the subject and clip path lists on `clear`, so the batches are merged
+            into a single execution rather than re-using the uploaded boundary across several.
+
+        :param paths: The set of boundary paths for trimming the lines
+        :param lineBatches: A list of sets of untrimmed lines to clip from the boundary
+        :return: A list of trimmed line (open path) sets corresponding to each input batch
+        """
+
+        batches = [lines.reshape(-1, 2, 3) for lines in lineBatches]
+
+        if len(batches) == 0:
+            return []
+
+        # Bias the sort ids so that every batch occupies a disjoint id range
+        extents = [int(np.max(batch[:, :, 2])) + 1 if len(batch) > 0 else 0 for batch in batches]
+        offsets = np.cumsum([0] + extents[:-1])
+
+        segs = np.vstack(batches)
+        segs[:, :, 2] += np.repeat(offsets, [len(batch) for batch in batches])[:, None]
+
+        pc2 = pyclipr.Clipper()
+        pc2.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
+
+        pc2.addPaths(segs, pyclipr.Subject, True)
+        pc2.addPaths(paths, pyclipr.Clip)
+        out = pc2.execute(pyclipr.Intersection, pyclipr.FillRule.NonZero, returnOpenPaths=True, returnZ=True)
+
+        if len(out[1]) == 0:
+            return [np.empty([0, 2, 3]) for _ in batches]
+
+        clippedLines = np.dstack([np.array(out[1]), np.array(out[3])])
+
+        # Separate the batches again from their biased id ranges and remove the bias
+        z = clippedLines[:, 0, 2]
+
+        results = []
+        for extent, offset in zip(extents, offsets):
+            batchLines = clippedLines[(z >= offset) & (z < offset + extent)].copy()
+            batchLines[:, :, 2] -= offset
+            results.append(batchLines)
+
+        return results
+
+    @staticmethod
+    def _clipLinesTiled(paths, lines, numDivisions: int):
+        """
+        Clips the hatch lines against the boundary paths using an :math:`n \\times n` spatial subdivision of
+        the boundary bounding box. The boundary is clipped against each tile rectangle once and only the hatch
+        vectors overlapping the tile are clipped against the reduced boundary - keeping each Clipper invocation
+        small. The sort order stored in the z component of each vector is preserved so the clipped output may
+        be re-ordered downstream as usual.
+
+        :param paths: The set of boundary paths for trimming the lines
+        :param lines: The untrimmed lines to clip from the boundary
+        :param numDivisions: The number of subdivisions along each axis
+        :return: A list of trimmed lines (open paths)
+        """
+
+        bbox = BaseHatcher.polygonBoundingBox(paths)
+
+        xDiv = np.linspace(bbox[0], bbox[2], numDivisions + 1)
+        yDiv = np.linspace(bbox[1], bbox[3], numDivisions + 1)
+
+        segs = lines.reshape(-1, 2, 3)
+
+        # The axis-aligned extents of each hatch vector used for assigning vectors to tiles
+        segMin = segs[:, :, :2].min(axis=1)
+        segMax = segs[:, :, :2].max(axis=1)
+
+        clippedLines = []
+
+        for i in range(numDivisions):
+            for j in range(numDivisions):
+
+                tile = np.array([[xDiv[i], yDiv[j]],
+                                 [xDiv[i + 1], yDiv[j]],
+                                 [xDiv[i + 1], yDiv[j + 1]],
+                                 [xDiv[i], yDiv[j + 1]]])
+
+                # Clip the boundary against the tile rectangle once per tile
+                pc = pyclipr.Clipper()
+                pc.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
+                pc.addPaths(paths, pyclipr.Subject)
+                pc.addPath(tile, pyclipr.Clip)
+                tilePaths = pc.execute(pyclipr.Intersection, pyclipr.FillRule.NonZero)
+
+                if len(tilePaths) == 0:
+                    continue
+
+                # Select only the hatch vectors whose extents overlap the tile
+                mask = (segMax[:, 0] >= xDiv[i]) & (segMin[:, 0] <= xDiv[i + 1]) & \
+                       (segMax[:, 1] >= yDiv[j]) & (segMin[:, 1] <= yDiv[j + 1])
+
+                if not np.any(mask):
+                    continue
+
+                pc2 = pyclipr.Clipper()
+                pc2.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
+                pc2.addPaths(segs[mask], pyclipr.Subject, True)
+                pc2.addPaths(tilePaths, pyclipr.Clip)
+                out = pc2.execute(pyclipr.Intersection, pyclipr.FillRule.NonZero,
+                                  returnOpenPaths=True, returnZ=True)
+
+                if len(out[1]) == 0:
+                    continue
+
+                clippedLines.append(np.dstack([np.array(out[1]), np.array(out[3])]))
+
+        if len(clippedLines) == 0:
+            return []
+
+        return np.vstack(clippedLines)
+
     @staticmethod
     def clipContourLines(paths, contourPaths: List[np.ndarray]):
         """
@@ -323,19 +795,21 @@ class BaseHatcher(abc.ABC):
 
         pc2 = pyclipr.Clipper()
         pc2.scaleFactor = int(BaseHatcher.CLIPPER_SCALEFACTOR)
-        lineList = np.array(contourPaths)
-        lineList = tuple(map(tuple, lineList))
+
+        # Pass the paths directly as contiguous ndarrays - pyclipr consumes these natively so there is no
+        # need to round-trip the coordinates through Python tuples
+        lineList = [np.ascontiguousarray(path, dtype=np.float64) for path in contourPaths]
 
         pc2.addPaths(lineList, pyclipr.Subject, True)
         pc2.addPaths(paths, pyclipr.Clip, False)
         out = pc2.execute(pyclipr.Intersection, pyclipr.FillRule.NonZero, returnOpenPaths=True, returnZ=True)
 
-        outPaths = []
+        outPaths = [None] * len(out[1])
 
         for i, path in enumerate(out[1]):
-            lineXY = np.array(path)
-            lineZ = np.array(out[3][i]).reshape(-1,1)
-            outPaths.append(np.hstack([lineXY, lineZ]))
+            lineXY = np.asarray(path)
+            lineZ = np.asarray(out[3][i]).reshape(-1,1)
+            outPaths[i] = np.hstack([lineXY, lineZ])
 
         return outPaths
 
@@ -360,32 +834,32 @@ class BaseHatcher(abc.ABC):
         # Get the bounding box of the paths
         bbox = self.boundaryBoundingBox(paths)
 
-        # Expand the bounding box
-        bboxCentre = np.mean(bbox.reshape(2, 2), axis=0)
-
-        # Calculates the diagonal length for which is the longest
-        diagonal = bbox[2:] - bboxCentre
-        bboxRadius = np.sqrt(diagonal.dot(diagonal))
-
-        # Construct a square which wraps the radius
-        x = np.tile(np.arange(-bboxRadius, bboxRadius, hatchSpacing, dtype=np.float32).reshape(-1, 1), (2)).flatten()
-        y = np.array([-bboxRadius, bboxRadius])
-        y = np.resize(y, x.shape)
-        z = np.arange(0, x.shape[0] / 2, 0.5).astype(np.int64)
-
-        coords = np.hstack([x.reshape(-1, 1),
-                            y.reshape(-1, 1),
-                            z.reshape(-1, 1)])
-
-        # Create the 2D rotation matrix with an additional row, column to preserve the hatch order
+        # The centre and circumscribing radius of the bounding box - computed in scalar form since the numpy
+        # dispatch overhead dominates the arithmetic at this size
+        cx = (bbox[0] + bbox[2]) * 0.5
+        cy = (bbox[1] + bbox[3]) * 0.5
+        bboxRadius = math.hypot(bbox[2] - cx, bbox[3] - cy)
+
+        # Construct a square which wraps the radius. Each hatch vector is built from an interleaved pair of
+        # x positions with alternating y extents and an increasing sort id in the z column.
+        x0 = np.arange(-bboxRadius, bboxRadius, hatchSpacing, dtype=np.float32)
+        x = np.repeat(x0, 2)
+        y = np.tile(np.array([-bboxRadius, bboxRadius], dtype=np.float32), x0.size)
+        z = np.repeat(np.arange(x0.size, dtype=np.int32), 2)
+
+        coords = np.empty([x.size, 3], dtype=np.float32)
+        coords[:, 0] = x
+        coords[:, 1] = y
+        coords[:, 2] = z
+
+        # Create the 2D rotation matrix - the z column stores the hatch sort order and is left untouched
+        # so it needn't participate in the rotation
         c, s = np.cos(theta_h), np.sin(theta_h)
-        R = np.array([(c, -s, 0),
-                      (s, c, 0),
-                      (0, 0, 1.0)])
+        R = np.array([(c, -s),
+                      (s, c)])
 
-        # Apply the rotation matrix and translate to bounding box centre
-        coords = np.matmul(R, coords.T)
-        coords = coords.T + np.hstack([bboxCentre, 0.0])
+        # Apply the rotation matrix and translate to bounding box centre on the (x,y) block only
+        coords[:, :2] = coords[:, :2] @ R.T + np.array([cx, cy])
 
         return coords
 
@@ -418,6 +892,9 @@ class InnerHatchRegion(abc.ABC):
         self._origin =  np.array([[0,0]])
         self._orientation = 0.0
 
+        self._R2D = None
+        self._R3D = None
+
         self._region = []
         self._requiresClipping = False
         self._isIntersecting = False
@@ -432,26 +909,25 @@ class InnerHatchRegion(abc.ABC):
         """
         R = self.rotationMatrix2D()
 
-        # Apply the rotation matrix and translate to bounding box centre
-        coords = np.matmul(R, coords.T)
-        coords = coords.T + np.hstack([self._origin])
-
-        return coords
+        # Apply the rotation matrix and translate to the origin
+        return coords @ R.T + self._origin
 
     def transformCoordinates(self, coords: np.ndarray) -> np.ndarray:
         """
         Transforms a set of (n x 3) coordinates with a sort id using the rotation angle
-        :attr:`InnerHatchRegion.orientation` using the 3D rotation matrix in :meth:`InnerHatchRegion.rotationMatrix3D`.
+        :attr:`InnerHatchRegion.orientation` using the 2D rotation matrix in
+        :meth:`InnerHatchRegion.rotationMatrix2D`. The transform is applied in-place on the :math:`(x,y)`
+        columns - the third column holds the sort id which is unaffected by the transformation.
 
         :param coords: (nx3) coordinates to be transformed
         :return:  The transformed coordinates
         """
 
-        R = self.rotationMatrix3D()
+        R = self.rotationMatrix2D()
 
-        # Apply the rotation matrix and translate to bounding box centre
-        coords = np.matmul(R, coords.T).T
-        coords[:,:2] += self._origin
+        # Apply the rotation matrix and translate to the origin on the (x,y) block only
+        coords[:, :2] = coords[:, :2] @ R.T
+        coords[:, :2] += self._origin
 
         return coords
 
@@ -459,30 +935,33 @@ class InnerHatchRegion(abc.ABC):
         """
         Generates an affine matrix covering the transformation based on the origin and orientation based on a rotation
         around the local coordinate system. This should be used when only a series of x,y coordinate required to be
-        transformed.
+        transformed. The matrix is cached and re-generated only when :attr:`orientation` changes.
 
         :return: Affine Transformation Matrix
         """
-        # Create the rotation matrix
-        c, s = np.cos(self._orientation), np.sin(self._orientation)
-        R = np.array([(c, -s),
-                      (s, c)])
-        return R
+        if self._R2D is None:
+            # Create the rotation matrix
+            c, s = np.cos(self._orientation), np.sin(self._orientation)
+            self._R2D = np.array([(c, -s),
+                                  (s, c)])
+        return self._R2D
 
     def rotationMatrix3D(self) -> np.ndarray:
         """
         Generates an affine matrix covering the transformation based on the origin and orientation based on a rotation
         around the local coordinate system. A pseudo third row and column is provided to retain the hatch sort id used.
+        The matrix is cached and re-generated only when :attr:`orientation` changes.
 
         :return: Affine Transformation Matrix
         """
-        # Create the rotation matrix
-        c, s = np.cos(self._orientation), np.sin(self._orientation)
-        R = np.array([(c, -s, 0),
-                      (s, c, 0),
-                      (0, 0, 1.0)])
+        if self._R3D is None:
+            # Create the rotation matrix
+            c, s = np.cos(self._orientation), np.sin(self._orientation)
+            self._R3D = np.array([(c, -s, 0),
+                                  (s, c, 0),
+                                  (0, 0, 1.0)])
 
-        return R
+        return self._R3D
 
     @property
     def orientation(self) -> float:
@@ -496,6 +975,10 @@ class InnerHatchRegion(abc.ABC):
     def orientation(self, angle: float):
         self._orientation = angle
 
+        # Invalidate the cached rotation matrices
+        self._R2D = None
+        self._R3D = None
+
     @property
     def origin(self):
         """ The origin is the :math:`(x',y')` position of the local coordinate system. """
@@ -748,6 +1231,12 @@ class Hatcher(BaseHatcher):
             return None
 
         layer = Layer(0, 0)
+
+        # When hatching is disabled and no contours are requested there is no geometry to generate, so the
+        # offsetting pipeline is skipped entirely
+        if not self.hatchingEnabled and self._numInnerContours + self._numOuterContours == 0:
+            return layer
+
         # First generate a boundary with the spot compensation applied
 
         offsetDelta = 1e-6
@@ -757,19 +1246,24 @@ class Hatcher(BaseHatcher):
         contourLayerGeometries = []
         hatchLayerGeometries = []
 
+        # The boundary paths are uploaded to a single offsetter which is re-used across the contour offsets
+        # since only the offset distance changes between each call. When tiled offsetting is enabled each
+        # offset is instead routed through offsetBoundary, which applies the spatial subdivision.
+        if BaseHatcher.OFFSET_NUM_DIVISIONS > 1:
+            executeOffset = lambda delta: self.offsetBoundary(boundaryFeature, delta)
+        else:
+            executeOffset = self.makeOffsetter(boundaryFeature).execute
+
+        # Pre-compute the static sequence of cumulative contour offsets so the offsets are generated in a
+        # single dispatch loop
+        contourOffsets = []
+
         for i in range(self._numOuterContours):
 
             if i > 0:
                 offsetDelta -= self._contourOffset
 
-            offsetBoundary = self.offsetBoundary(boundaryFeature, offsetDelta)
-
-            for path in offsetBoundary:
-                contourGeometry = ContourGeometry()
-                coords = np.vstack([path, path[0]])
-                contourGeometry.coords = coords
-                contourGeometry.subType = "outer"
-                contourLayerGeometries.append(contourGeometry)  # Append to the layer
+            contourOffsets.append((offsetDelta, "outer"))
 
         # Repeat for inner contours
         for i in range(self._numInnerContours):
@@ -777,23 +1271,18 @@ class Hatcher(BaseHatcher):
             if (self._numOuterContours == 0 and i > 0) or self._numOuterContours > 0:
                     offsetDelta -= self._contourOffset
 
-            offsetBoundary = self.offsetBoundary(boundaryFeature, offsetDelta)
-
-            for path in offsetBoundary:
+            contourOffsets.append((offsetDelta, "inner"))
 
-                contourGeometry = ContourGeometry()
-                coords = np.vstack([path, path[0]])
-                contourGeometry.coords = coords
-                contourGeometry.subType = "inner"
-                contourLayerGeometries.append(contourGeometry)  # Append to the layer
+        for delta, subType in contourOffsets:
+            # Append the closed contours to the layer
+            contourLayerGeometries.extend(self._buildContourGeometries(executeOffset(delta), subType))
 
         # The final offset is applied to the boundary if there has been existing contour offsets applied
         if self._numInnerContours + self._numOuterContours > 0:
             offsetDelta -= self._volOffsetHatch
 
-        curBoundary = self.offsetBoundary(boundaryFeature, offsetDelta)
-
-        scanVectors = []
+        # The hatched boundary is only required when hatching is enabled
+        curBoundary = executeOffset(offsetDelta) if self.hatchingEnabled else []
 
         if self.hatchingEnabled and len(curBoundary) > 0:
             paths = curBoundary
@@ -820,21 +1309,32 @@ class Hatcher(BaseHatcher):
 
                 clippedLines = BaseHatcher.clipperToHatchArray(clippedPaths)
 
-                # Extract only x-y coordinates and sort based on the pseudo-order stored in the z component.
-                clippedLines = clippedLines[:, :, :3]
-                id = np.argsort(clippedLines[:, 0, 2])
-                clippedLines = clippedLines[id, :, :]
+                """
+                The coordinates are processed as separate x and y columns (structure-of-arrays). The sort on
+                the pseudo-order stored in the z component then only gathers two compact columns and the final
+                (x,y) list is assembled directly without re-copying the full interleaved array.
 
-                scanVectors.append(clippedLines)
+                The pseudo-order was generated as an increasing integer sequence, so the sort runs on the
+                integer column - and is skipped entirely in the common case where clipping has preserved the
+                sweep order of the hatch vectors.
+                """
+                z = clippedLines[:, 0, 2].astype(np.int32)
+
+                if np.all(z[1:] >= z[:-1]):
+                    xs = clippedLines[:, :, 0].ravel()
+                    ys = clippedLines[:, :, 1].ravel()
+                else:
+                    id = np.argsort(z, kind='stable')
+
+                    xs = clippedLines[:, :, 0][id].ravel()
+                    ys = clippedLines[:, :, 1][id].ravel()
 
                 # Scan vectors have been created for the hatched region
 
                 # Construct a HatchGeometry containing the list of points
                 hatchGeom = HatchGeometry()
 
-                # Only copy the (x,y) points from the coordinate array.
-                hatchVectors = np.vstack(scanVectors)
-                hatchVectors = hatchVectors[:, :, :2].reshape(-1, 2)
+                hatchVectors = np.column_stack([xs, ys])
 
                 # Note the does not require positional sorting
                 if self.hatchSortMethod:
@@ -842,41 +1342,6 @@ class Hatcher(BaseHatcher):
 
                 hatchGeom.coords = hatchVectors
                 hatchLayerGeometries.append(hatchGeom)
-        if False:
-            # Iterate through each closed polygon region in the slice. The currently individually sliced.
-            for contour in curBoundary:
-                # print('{:=^60} \n'.format(' Generating hatches '))
-
-                paths = contour
-
-                # Hatch angle will change per layer
-                # TODO change the layer angle increment
-                layerHatchAngle = np.mod(self._hatchAngle + self._layerAngleIncrement, 180)
-
-                # The layer hatch angle needs to be bound by +ve X vector (i.e. -90 < theta_h < 90 )
-                if layerHatchAngle > 90:
-                    layerHatchAngle = layerHatchAngle - 180
-
-                # Generate the un-clipped hatch regions based on the layer hatchAngle and hatch distance
-                hatches = self.generateHatching(paths, self._hatchDistance, layerHatchAngle)
-
-                # Clip the hatch fill to the boundary
-                clippedPaths = self.clipLines(paths, hatches)
-
-                # Merge the lines together
-                if len(clippedPaths) == 0:
-                    continue
-
-                clippedLines = self.clipperToHatchArray(clippedPaths)
-
-                # Extract only x-y coordinates and sort based on the pseudo-order stored in the z component.
-                clippedLines = clippedLines[:, :, :3]
-                id = np.argsort(clippedLines[:, 0, 2])
-                clippedLines = clippedLines[id, :, :]
-
-                scanVectors.append(clippedLines)
-
-
 
         if self._scanContourFirst:
             layer.geometry.extend(contourLayerGeometries + hatchLayerGeometries)
@@ -906,6 +1371,10 @@ class StripeHatcher(Hatcher):
         self._stripeOverlap = 0.1
         self._stripeOffset = 0.5
 
+        self._templateKey = None
+        self._template = None
+        self._rotatedTemplates = {}
+
     def __str__(self):
         return 'StripeHatcher'
 
@@ -958,48 +1427,108 @@ class StripeHatcher(Hatcher):
         # Get the bounding box of the paths
         bbox = self.boundaryBoundingBox(paths)
 
-        # Expand the bounding box
-        bboxCentre = np.mean(bbox.reshape(2, 2), axis=0)
+        # The centre and circumscribing radius of the bounding box - computed in scalar form since the numpy
+        # dispatch overhead dominates the arithmetic at this size
+        cx = (bbox[0] + bbox[2]) * 0.5
+        cy = (bbox[1] + bbox[3]) * 0.5
+        bboxRadius = math.hypot(bbox[2] - cx, bbox[3] - cy)
+
+        """
+        The un-rotated stripe template depends only on the bounding box and the stripe parameters, which are
+        typically constant across the layers of a part, so it is cached on the instance and only the layer
+        rotation and translation are re-applied per call.
+        """
+        templateKey = (*bbox, hatchSpacing, self._stripeWidth, self._stripeOverlap, self._stripeOffset)
+
+        if templateKey != self._templateKey:
+            self._template = self._buildStripeTemplate(bboxRadius, hatchSpacing)
+            self._templateKey = templateKey
+            self._rotatedTemplates = {}
+
+        """
+        The set of layer hatch angles typically repeats after a small number of layers, so the rotated
+        template is cached per angle as well - a repeat layer then only costs the dictionary lookup. The
+        cached arrays are returned directly and must not be modified by the caller.
+        """
+        angleKey = round(float(hatchAngle), 6)
+        coords = self._rotatedTemplates.get(angleKey)
+
+        if coords is None:
+
+            # Rotate and translate the (x,y) columns of the template to the bounding box centre, leaving the
+            # sort order column untouched. The rotation constants are cast to float32 so that the coordinates
+            # remain at single precision until the scaling required by the clipping stage.
+            c = np.float32(np.cos(theta_h))
+            s = np.float32(np.sin(theta_h))
+            cx, cy = np.float32(cx), np.float32(cy)
 
-        # Calculates the diagonal length for which is the longest
-        diagonal = bbox[2:] - bboxCentre
-        bboxRadius = np.sqrt(diagonal.dot(diagonal))
+            template = self._template
+            coords = np.empty_like(template)
+            coords[:, 0] = c * template[:, 0] - s * template[:, 1] + cx
+            coords[:, 1] = s * template[:, 0] + c * template[:, 1] + cy
+            coords[:, 2] = template[:, 2]
+
+            # Bound the cache for angle schedules which never repeat
+            if len(self._rotatedTemplates) >= 64:
+                self._rotatedTemplates.clear()
+
+            self._rotatedTemplates[angleKey] = coords
+
+        return coords
+
+    def _buildStripeTemplate(self, bboxRadius: float, hatchSpacing: float) -> np.ndarray:
+        """
+        Assembles the un-rotated stripe hatch template covering the bounding box of the boundary.
+
+        :param bboxRadius: The circumscribing radius of the boundary bounding box
+        :param hatchSpacing: The hatch spacing to use for scan vectors
+        :return: The un-rotated scan vectors with their sort order
+        """
 
         numStripes = int(2 * bboxRadius / self._stripeWidth) + 1
 
-        # Construct a square which wraps the radius
-        hatchOrder = 0
-        coords = []
+        """
+        Construct a square which wraps the radius. Only the stripe parity affects the y samples - odd stripes
+        are shifted by the stripe offset - so the two candidate sample rows are generated once and the entire
+        stripe set is assembled with vectorised gather operations rather than a per-stripe Python loop.
+        """
+        shift = self._stripeOffset * hatchSpacing
+        ysEven = np.arange(-bboxRadius, bboxRadius, hatchSpacing, dtype=np.float32)
+        ysOdd = np.arange(-bboxRadius + shift, bboxRadius + shift, hatchSpacing, dtype=np.float32)
 
-        for i in np.arange(0, numStripes):
-            startX = -bboxRadius + i * self._stripeWidth - self._stripeOverlap
-            endX = startX + self._stripeWidth + self._stripeOverlap
+        parity = np.arange(numStripes) & 1
+        numSamples = np.where(parity == 1, ysOdd.size, ysEven.size)
 
-            y = np.tile(np.arange(-bboxRadius + np.mod(i, 2) * self._stripeOffset * hatchSpacing,
-                                  bboxRadius + np.mod(i, 2) * self._stripeOffset * hatchSpacing, hatchSpacing,
-                                  dtype=np.float32).reshape(-1, 1), (2)).flatten()
-            # x = np.tile(np.arange(startX, endX, hatchSpacing, dtype=np.float32).reshape(-1, 1), (2)).flatten()
-            x = np.array([startX, endX])
-            x = np.resize(x, y.shape)
-            z = np.arange(hatchOrder, hatchOrder + y.shape[0] / 2, 0.5).astype(np.int64)
+        yRows = np.zeros([2, max(ysEven.size, ysOdd.size)], dtype=np.float32)
+        yRows[0, :ysEven.size] = ysEven
+        yRows[1, :ysOdd.size] = ysOdd
 
-            hatchOrder += x.shape[0] / 2
+        # The x extents of each stripe
+        startX = -bboxRadius + np.arange(numStripes) * self._stripeWidth - self._stripeOverlap
+        endX = startX + self._stripeWidth + self._stripeOverlap
 
-            coords += [np.hstack([x.reshape(-1, 1),
-                                  y.reshape(-1, 1),
-                                  z.reshape(-1, 1)])]
+        # Recover the stripe index and the y sample index of every row from a global running index
+        counts = 2 * numSamples
+        rowStarts = np.cumsum(counts) - counts
+        totalRows = int(counts.sum())
 
-        coords = np.vstack(coords)
+        # The sort order increments per vector continuing across the stripes
+        orderBase = np.cumsum(numSamples) - numSamples
 
-        # Create the rotation matrix
-        c, s = np.cos(theta_h), np.sin(theta_h)
-        R = np.array([(c, -s, 0),
-                      (s, c, 0),
-                      (0, 0, 1.0)])
+        if njit is not None:
+            # Assemble the stripes in a single pass using the compiled kernel
+            coords = np.empty([totalRows, 3], dtype=np.float32)
+            _buildStripeHatchKernel(startX, endX, yRows, parity, numSamples, rowStarts, orderBase, coords)
+            return coords
 
-        # Apply the rotation matrix and translate to bounding box centre
-        coords = np.matmul(R, coords.T)
-        coords = coords.T + np.hstack([bboxCentre, 0.0])
+        stripeIdx = np.repeat(np.arange(numStripes), counts)
+        within = np.arange(totalRows) - np.repeat(rowStarts, counts)
+        sample = within >> 1
+
+        coords = np.empty([totalRows, 3], dtype=np.float32)
+        coords[:, 0] = np.where(within & 1, endX[stripeIdx], startX[stripeIdx])
+        coords[:, 1] = yRows[parity[stripeIdx], sample]
+        coords[:, 2] = np.repeat(orderBase, counts) + sample
 
         return coords
 
@@ -1035,6 +1564,10 @@ class BasicIslandHatcher(Hatcher):
         self._islandOverlap = 0.1
         self._islandOffset = 0.5
 
+        self._templateKey = None
+        self._template = None
+        self._rotatedTemplates = {}
+
     def __str__(self):
         return 'IslandHatcher'
 
@@ -1084,62 +1617,119 @@ class BasicIslandHatcher(Hatcher):
         # Get the bounding box of the paths
         bbox = self.boundaryBoundingBox(paths)
 
-        # Expand the bounding box
-        bboxCentre = np.mean(bbox.reshape(2, 2), axis=0)
+        # The centre and circumscribing radius of the bounding box - computed in scalar form since the numpy
+        # dispatch overhead dominates the arithmetic at this size
+        cx = (bbox[0] + bbox[2]) * 0.5
+        cy = (bbox[1] + bbox[3]) * 0.5
+        bboxRadius = math.hypot(bbox[2] - cx, bbox[3] - cy)
 
-        # Calculates the diagonal length for which is the longest
-        diagonal = bbox[2:] - bboxCentre
-        bboxRadius = np.sqrt(diagonal.dot(diagonal))
+        """
+        The un-rotated island template depends only on the bounding box and the island parameters, which are
+        typically constant across the layers of a part, so it is cached on the instance and only the layer
+        rotation and translation are re-applied per call.
+        """
+        templateKey = (*bbox, hatchSpacing, self._islandWidth, self._islandOverlap, self._islandOffset)
 
-        numIslands = int(2 * bboxRadius / self._islandWidth) + 1
+        if templateKey != self._templateKey:
+            self._template = self._buildIslandTemplate(bboxRadius, hatchSpacing)
+            self._templateKey = templateKey
+            self._rotatedTemplates = {}
 
-        # Construct a square which wraps the radius
-        hatchOrder = 0
-        coords = []
+        """
+        The set of layer hatch angles typically repeats after a small number of layers, so the rotated
+        template is cached per angle as well - a repeat layer then only costs the dictionary lookup. The
+        cached arrays are returned directly and must not be modified by the caller.
+        """
+        angleKey = round(float(hatchAngle), 6)
+        coords = self._rotatedTemplates.get(angleKey)
 
-        for i in np.arange(0, numIslands):
-            for j in np.arange(0, numIslands):
+        if coords is None:
 
-                startX = -bboxRadius + i * (self._islandWidth) - self._islandOverlap
-                endX = startX + (self._islandWidth) + self._islandOverlap
+            # Rotate and translate the (x,y) columns of the template to the bounding box centre, leaving the
+            # sort order column untouched. The rotation constants are cast to float32 so that the coordinates
+            # remain at single precision until the scaling required by the clipping stage.
+            c = np.float32(np.cos(theta_h))
+            s = np.float32(np.sin(theta_h))
+            cx, cy = np.float32(cx), np.float32(cy)
 
-                startY = -bboxRadius + j * (self._islandWidth) - self._islandOverlap
-                endY = startY + (self._islandWidth) + self._islandOverlap
+            template = self._template
+            coords = np.empty_like(template)
+            coords[:, 0] = c * template[:, 0] - s * template[:, 1] + cx
+            coords[:, 1] = s * template[:, 0] + c * template[:, 1] + cy
+            coords[:, 2] = template[:, 2]
 
-                if np.mod(i + j, 2):
-                    y = np.tile(np.arange(startY + np.mod(i + j, 2) * self._islandOffset * hatchSpacing,
-                                          endY + np.mod(i + j, 2) * self._islandOffset * hatchSpacing, hatchSpacing,
-                                          dtype=np.float32).reshape(-1, 1), (2)).flatten()
+            # Bound the cache for angle schedules which never repeat
+            if len(self._rotatedTemplates) >= 64:
+                self._rotatedTemplates.clear()
 
-                    x = np.array([startX, endX])
-                    x = np.resize(x, y.shape)
-                    z = np.arange(hatchOrder, hatchOrder + y.shape[0] / 2, 0.5).astype(np.int64)
+            self._rotatedTemplates[angleKey] = coords
 
-                else:
-                    x = np.tile(np.arange(startX + np.mod(i + j, 2) * self._islandOffset * hatchSpacing,
-                                          endX + np.mod(i + j, 2) * self._islandOffset * hatchSpacing, hatchSpacing,
-                                          dtype=np.float32).reshape(-1, 1), (2)).flatten()
+        return coords
 
-                    y = np.array([startY, endY])
-                    y = np.resize(y, x.shape)
-                    z = np.arange(hatchOrder, hatchOrder + y.shape[0] / 2, 0.5).astype(np.int64)
+    def _buildIslandTemplate(self, bboxRadius: float, hatchSpacing: float) -> np.ndarray:
+        """
+        Assembles the un-rotated island hatch template covering the bounding box of the boundary.
 
-                hatchOrder += x.shape[0] / 2
+        :param bboxRadius: The circumscribing radius of the boundary bounding box
+        :param hatchSpacing: The hatch spacing
+        :return: The un-rotated scan vectors with their sort order
+        """
 
-                coords += [np.hstack([x.reshape(-1, 1),
-                                      y.reshape(-1, 1),
-                                      z.reshape(-1, 1)])]
+        numIslands = int(2 * bboxRadius / self._islandWidth) + 1
 
-        coords = np.vstack(coords)
+        """
+        Construct a square which wraps the radius. All the (i,j) island indices are generated at once via a
+        meshgrid, and the hatch vectors for every island are assembled with vectorised gather operations
+        rather than the nested per-island Python loops. The scan axis alternates with the island parity - odd
+        islands sample along y with fixed x extents and even islands sample along x with fixed y extents.
+        """
+        I, J = np.meshgrid(np.arange(numIslands), np.arange(numIslands), indexing='ij')
+        I = I.ravel()
+        J = J.ravel()
+        parity = (I + J) % 2 == 1
 
-        # Create the rotation matrix
-        c, s = np.cos(theta_h), np.sin(theta_h)
-        R = np.array([(c, -s, 0),
-                      (s, c, 0),
-                      (0, 0, 1.0)])
+        startX = -bboxRadius + I * self._islandWidth - self._islandOverlap
+        endX = startX + self._islandWidth + self._islandOverlap
+
+        startY = -bboxRadius + J * self._islandWidth - self._islandOverlap
+        endY = startY + self._islandWidth + self._islandOverlap
+
+        # Odd parity islands are additionally shifted along the scan axis by the island offset
+        shift = self._islandOffset * hatchSpacing
+        sampleStart = np.where(parity, startY + shift, startX)
+        sampleEnd = np.where(parity, endY + shift, endX)
+
+        # Recover the island index and the sample index of every row from a global running index
+        numSamples = np.ceil((sampleEnd - sampleStart) / hatchSpacing).astype(np.int64)
+        counts = 2 * numSamples
+        rowStarts = np.cumsum(counts) - counts
+        totalRows = int(counts.sum())
+
+        # The sort order increments per vector continuing across the islands
+        orderBase = np.cumsum(numSamples) - numSamples
+
+        if njit is not None:
+            # Assemble the islands in a single pass using the compiled kernel
+            coords = np.empty([totalRows, 3], dtype=np.float32)
+            _buildIslandHatchKernel(startX, endX, startY, endY, sampleStart, parity, numSamples, rowStarts,
+                                    orderBase, hatchSpacing, coords)
+            return coords
+
+        islandIdx = np.repeat(np.arange(I.size), counts)
+        within = np.arange(totalRows) - np.repeat(rowStarts, counts)
+        sample = within >> 1
+
+        # The position along the scan axis and the alternating fixed extents across it
+        samplePos = (sampleStart[islandIdx] + sample * hatchSpacing).astype(np.float32)
+        fixedPos = np.where(within & 1,
+                            np.where(parity[islandIdx], endX[islandIdx], endY[islandIdx]),
+                            np.where(parity[islandIdx], startX[islandIdx], startY[islandIdx]))
+
+        odd = parity[islandIdx]
 
-        # Apply the rotation matrix and translate to bounding box centre
-        coords = np.matmul(R, coords.T)
-        coords = coords.T + np.hstack([bboxCentre, 0.0])
+        coords = np.empty([totalRows, 3], dtype=np.float32)
+        coords[:, 0] = np.where(odd, fixedPos, samplePos)
+        coords[:, 1] = np.where(odd, samplePos, fixedPos)
+        coords[:, 2] = np.repeat(orderBase, counts) + sample
 
         return coords
@@ -117,19 +117,26 @@ class Island(InnerHatchRegion):
         endY = self._islandWidth + self._islandOverlap
 
         if isOdd:
-            y = np.tile(np.arange(startY, endY, self._hatchDistance).reshape(-1, 1), 2).flatten()
-            x = np.array([startX, endX])
-            x = np.resize(x, y.shape)
+            samples = np.arange(startY, endY, self._hatchDistance)
         else:
-            x = np.tile(np.arange(startX, endX, self._hatchDistance).reshape(-1, 1), 2).flatten()
-            y = np.array([startY, endY])
-            y = np.resize(y, x.shape)
+            samples = np.arange(startX, endX, self._hatchDistance)
 
-        z = np.arange(0, y.shape[0] / 2, 0.5).astype(np.int64)
+        # The coordinates are written directly into a single pre-sized buffer rather than assembled from
+        # separate per-column arrays
+        coords = np.empty([2 * samples.shape[0], 3])
 
-        return np.hstack([x.reshape(-1, 1),
-                          y.reshape(-1, 1),
-                          z.reshape(-1,1)])
+        if isOdd:
+            coords[:, 1] = np.repeat(samples, 2)
+            coords[0::2, 0] = startX
+            coords[1::2, 0] = endX
+        else:
+            coords[:, 0] = np.repeat(samples, 2)
+            coords[0::2, 1] = startY
+            coords[1::2, 1] = endY
+
+        coords[:, 2] = np.repeat(np.arange(samples.shape[0]), 2)
+
+        return coords
 
     def hatch(self) -> np.ndarray:
         """
@@ -295,12 +302,8 @@ class IslandHatcher(Hatcher):
             offsetDelta -= self._contourOffset
             offsetBoundary = self.offsetBoundary(boundaryFeature, offsetDelta)
 
-            for path in offsetBoundary:
-                contourGeometry = ContourGeometry()
-                coords = np.vstack([path, path[0]])
-                contourGeometry.coords = coords
-                contourGeometry.subType = "outer"
-                layer.geometry.append(contourGeometry)  # Append to the layer
+            # Close each ring and build the contour geometries through a single batched pass
+            layer.geometry.extend(self._buildContourGeometries(offsetBoundary, "outer"))
 
         # Repeat for inner contours
         for i in range(self._numInnerContours):
@@ -308,12 +311,7 @@ class IslandHatcher(Hatcher):
             offsetDelta -= self._contourOffset
             offsetBoundary = self.offsetBoundary(boundaryFeature, offsetDelta)
 
-            for path in offsetBoundary:
-                contourGeometry = ContourGeometry()
-                coords = np.vstack([path, path[0]])
-                contourGeometry.coords = coords
-                contourGeometry.subType = "inner"
-                layer.geometry.append(contourGeometry)  # Append to the layer
+            layer.geometry.extend(self._buildContourGeometries(offsetBoundary, "inner"))
 
         # The final offset is applied to the boundary
 
@@ -367,7 +367,7 @@ class GridBlockSupport(BlockSupportBase):
         bboxRadius = np.ceil(np.sqrt(diagonal.dot(diagonal)) / hatchSpacing) * hatchSpacing
 
         # Construct a square which wraps the radius
-        x = np.tile(np.arange(-bboxRadius, bboxRadius, hatchSpacing, dtype=np.float32).reshape(-1, 1), (2)).flatten()
+        x = np.repeat(np.arange(-bboxRadius, bboxRadius, hatchSpacing, dtype=np.float32), 2)
         y = np.array([-bboxRadius, bboxRadius])
         y = np.resize(y, x.shape)
         z = np.arange(0, x.shape[0] / 2, 0.5).astype(np.int64)